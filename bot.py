@@ -1,14 +1,17 @@
 import os
-import json
+import re
+import time
+import random
+import asyncio
 import logging
 import datetime
 from pathlib import Path
 import aiohttp
+import orjson
 from dotenv import load_dotenv
 import discord
 from discord import app_commands
 from discord.ext import commands
-import math
 
 load_dotenv()
 
@@ -22,9 +25,37 @@ if not TOKEN or not CLIENT_ID:
     logger.error("Missing environment variables. Please set DISCORD_TOKEN and CLIENT_ID.")
     exit(1)
 
+NEKOTINA_BASE_URL = "https://nekotina.com"
+
+# Shared HTTP session, created in setup_hook so it binds to the bot's event loop
+SESSION: aiohttp.ClientSession | None = None
+
+class PlatanoBot(commands.Bot):
+    async def setup_hook(self):
+        global SESSION, BOT_CREATED_AT_FMT
+        # bot.user is already set after login, and interactions can arrive before on_ready
+        BOT_CREATED_AT_FMT = discord.utils.format_dt(self.user.created_at, style="F")
+        SESSION = aiohttp.ClientSession(
+            base_url=NEKOTINA_BASE_URL,
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        )
+        self.meetups_flusher = asyncio.create_task(flush_meetups_periodically())
+
+    async def close(self):
+        if getattr(self, 'meetups_flusher', None) is not None:
+            # Holding the write lock ensures the flusher isn't cancelled mid-write
+            async with _MEETUPS_WRITE_LOCK:
+                self.meetups_flusher.cancel()
+        await super().close()
+        # Flush after disconnecting so changes saved by the last interactions aren't lost
+        await flush_meetups()
+        if SESSION is not None and not SESSION.closed:
+            await SESSION.close()
+
 intents = discord.Intents.default()
 intents.message_content = True  
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = PlatanoBot(command_prefix='!', intents=intents)
 
 logger.info("Note: This bot uses privileged intents. Make sure to enable them in the Discord Developer Portal.")
 logger.info("Visit: https://discord.com/developers/applications/ -> Your Application -> Bot -> Privileged Gateway Intents")
@@ -34,54 +65,219 @@ DATA_DIR = Path(__file__).parent / 'data'
 DATA_DIR.mkdir(exist_ok=True)
 
 MEETUPS_FILE = DATA_DIR / 'meetups.json'
+MEETUPS_TMP_FILE = MEETUPS_FILE.with_suffix('.json.tmp')
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+DATE_REGEX = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+TIME_REGEX = re.compile(r'^\d{2}:\d{2}$')
 
 if not MEETUPS_FILE.exists():
-    default_meetups = {"meetups": []}
-    with open(MEETUPS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(default_meetups, f, indent=2)
+    default_meetups = {"meetups": [], "next_id": 1}
+    MEETUPS_FILE.write_bytes(orjson.dumps(default_meetups, option=JSON_OPTIONS))
+
+# In-memory copy of meetups.json, only re-read when the file's mtime changes.
+# Meetups are kept as a dict keyed by id and written back to disk as a list.
+_MEETUPS_CACHE = None
+_MEETUPS_MTIME = 0.0
+# Bumped by every save_meetups, to discard reloads that raced with a change
+_MEETUPS_GENERATION = 0
+_MEETUPS_RELOAD_LOCK = asyncio.Lock()
+
+# save_meetups only marks the cache dirty; a background task batches the
+# pending changes into a single write every MEETUPS_FLUSH_DELAY seconds.
+MEETUPS_FLUSH_DELAY = 0.25
+MEETUPS_FLUSH_MAX_DELAY = 60
+_MEETUPS_DIRTY = asyncio.Event()
+_MEETUPS_WRITE_LOCK = asyncio.Lock()
+
+def meetups_pending():
+    return _MEETUPS_DIRTY.is_set() or _MEETUPS_WRITE_LOCK.locked()
+
+def read_meetups_file():
+    raw = orjson.loads(MEETUPS_FILE.read_bytes())
+    return {**raw, "meetups": {meetup["id"]: meetup for meetup in raw["meetups"]}}
 
-def get_meetups():
+def meetups_need_reload(st):
+    # Never reload over changes that have not been flushed yet
+    return _MEETUPS_CACHE is None or (_MEETUPS_MTIME != st.st_mtime and not meetups_pending())
+
+async def get_meetups():
+    global _MEETUPS_CACHE, _MEETUPS_MTIME
     try:
-        with open(MEETUPS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if not meetups_need_reload(MEETUPS_FILE.stat()):
+            return _MEETUPS_CACHE
+        # One reload at a time, so a slow read can't install data older than another reload's
+        async with _MEETUPS_RELOAD_LOCK:
+            st = MEETUPS_FILE.stat()
+            if not meetups_need_reload(st):
+                return _MEETUPS_CACHE
+            generation = _MEETUPS_GENERATION
+            meetups_data = await asyncio.to_thread(read_meetups_file)
+            # Another handler saved changes while the file was being read
+            if _MEETUPS_CACHE is not None and (generation != _MEETUPS_GENERATION or meetups_pending()):
+                return _MEETUPS_CACHE
+            _MEETUPS_CACHE = meetups_data
+            _MEETUPS_MTIME = st.st_mtime
+            invalidate_quedadas_message()
+            if "next_id" not in meetups_data:
+                # Migrate files written before the counter existed; the migrated
+                # data is returned even if persisting it fails
+                meetups_data["next_id"] = max(meetups_data["meetups"], default=0) + 1
+                save_meetups(meetups_data)
+            return meetups_data
     except Exception as e:
-        logger.error(f"Error reading meetups file: {e}")
-        return {"meetups": []}
+        logger.error("Error reading meetups file: %s", e)
+        return {"meetups": {}, "next_id": 1}
 
-def save_meetups(meetups_data):
+def write_meetups_file(meetups_data):
     try:
-        with open(MEETUPS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(meetups_data, f, indent=2)
-        return True
+        payload = orjson.dumps(meetups_data, option=JSON_OPTIONS)
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        with open(MEETUPS_TMP_FILE, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(MEETUPS_TMP_FILE, MEETUPS_FILE)
+        return MEETUPS_FILE.stat().st_mtime
     except Exception as e:
-        logger.error(f"Error saving meetups file: {e}")
-        return False
+        logger.error("Error saving meetups file: %s", e)
+        return None
+
+def save_meetups(meetups_data):
+    global _MEETUPS_CACHE, _MEETUPS_GENERATION
+    _MEETUPS_CACHE = meetups_data
+    _MEETUPS_GENERATION += 1
+    invalidate_quedadas_message()
+    _MEETUPS_DIRTY.set()
 
-def generate_meetup_id():
-    meetups_data = get_meetups()
-    ids = [meetup["id"] for meetup in meetups_data["meetups"]]
-    return max(ids) + 1 if ids else 1
+async def flush_meetups():
+    global _MEETUPS_MTIME
+    async with _MEETUPS_WRITE_LOCK:
+        if not _MEETUPS_DIRTY.is_set():
+            return True
+        _MEETUPS_DIRTY.clear()
+        # Snapshot on the event loop so handlers can keep mutating the cache
+        snapshot = {**_MEETUPS_CACHE, "meetups": list(_MEETUPS_CACHE["meetups"].values())}
+        mtime = await asyncio.to_thread(write_meetups_file, snapshot)
+        if mtime is None:
+            # Keep the changes pending so a later flush retries them
+            _MEETUPS_DIRTY.set()
+            return False
+        _MEETUPS_MTIME = mtime
+        return True
 
-async def fetch_nekotina_gif(type):
+async def flush_meetups_periodically():
+    delay = MEETUPS_FLUSH_DELAY
+    while True:
+        await _MEETUPS_DIRTY.wait()
+        await asyncio.sleep(delay)
+        if await flush_meetups():
+            delay = MEETUPS_FLUSH_DELAY
+        else:
+            # Back off while the disk keeps failing instead of retrying every flush
+            delay = min(delay * 2, MEETUPS_FLUSH_MAX_DELAY)
+
+def generate_meetup_id(meetups_data):
+    new_id = meetups_data["next_id"]
+    meetups_data["next_id"] = new_id + 1
+    return new_id
+
+# Recently fetched GIF URLs per type: type -> (last fetch time, urls).
+# nekotina returns a random GIF per request, so once the pool is full we
+# serve from it until it expires instead of hitting the API.
+GIF_CACHE_TTL = 60
+GIF_CACHE_SIZE = 20
+_GIF_CACHE = {}
+# In-flight refresh per type, shared by every caller that misses the cache meanwhile
+_GIF_FETCHES = {}
+
+async def request_nekotina_gif(type):
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://nekotina.com/api/v2/{type}") as response:
-                if response.status != 200:
-                    raise Exception(f"Error fetching {type} GIF: {response.status}")
-                data = await response.json()
-                return data["url"]
+        async with SESSION.get(f"/api/v2/{type}") as response:
+            if response.status != 200:
+                raise Exception(f"Error fetching {type} GIF: {response.status}")
+            data = await response.json()
+            return data["url"]
     except Exception as e:
-        logger.error(f"Error fetching {type} GIF: {e}")
+        logger.error("Error fetching %s GIF: %s", type, e)
         return None
 
+async def refresh_gif_cache(type):
+    try:
+        url = await request_nekotina_gif(type)
+        cached = _GIF_CACHE.get(type)
+        if url is None:
+            # Fall back to a stale URL if there is one
+            return random.choice(cached[1]) if cached else None
+        
+        fresh = cached is not None and time.monotonic() - cached[0] < GIF_CACHE_TTL
+        urls = cached[1] if fresh else []
+        urls.append(url)
+        del urls[:-GIF_CACHE_SIZE]
+        _GIF_CACHE[type] = (time.monotonic(), urls)
+        return url
+    finally:
+        _GIF_FETCHES.pop(type, None)
+
+async def fetch_nekotina_gif(type):
+    cached = _GIF_CACHE.get(type)
+    if cached and time.monotonic() - cached[0] < GIF_CACHE_TTL and len(cached[1]) >= GIF_CACHE_SIZE:
+        return random.choice(cached[1])
+    
+    task = _GIF_FETCHES.get(type)
+    started = task is None
+    if started:
+        task = _GIF_FETCHES[type] = asyncio.create_task(refresh_gif_cache(type))
+    # Shield so a cancelled caller doesn't cancel the fetch other callers are waiting on
+    url = await asyncio.shield(task)
+    if started or url is None:
+        return url
+    
+    # Callers that joined another's fetch pick from the refreshed pool for variety
+    cached = _GIF_CACHE.get(type)
+    return random.choice(cached[1]) if cached else url
+
+FOOTER_TEXT = "Platanotorrino Discord Bot"
+HELP_FOOTER_TEXT = "Usa /help <categoria> para ver comandos específicos"
+
+def stamp_embed(embed, footer=FOOTER_TEXT):
+    embed.timestamp = datetime.datetime.now()
+    embed.set_footer(text=footer)
+    return embed
+
+def format_bytes(bytes, decimals=2):
+    if bytes == 0:
+        return '0 Bytes'
+    dm = max(0, decimals)
+    sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB']
+    i = min(max(0, (bytes.bit_length() - 1) // 10), len(sizes) - 1)
+    return f"{bytes / (1 << (10 * i)):.{dm}f} {sizes[i]}"
+
+# /botinfo stats never change at runtime, so compute them once
+def get_file_stats(path):
+    if not path.is_file():
+        return 0, 0
+    data = path.read_bytes()
+    lines = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+    return lines, len(data)
+
+BOT_FILE_PATH = Path(__file__)
+BOT_FILE_LINES, BOT_FILE_SIZE = get_file_stats(BOT_FILE_PATH)
+BOT_FILE_SIZE_FMT = format_bytes(BOT_FILE_SIZE)
+
+# Filled in setup_hook, once bot.user is available
+BOT_CREATED_AT_FMT = None
+
 @bot.event
 async def on_ready():
-    logger.info(f'Logged in as {bot.user.name} ({bot.user.id})')
+    global HELP_EMBEDS
+    logger.info('Logged in as %s (%s)', bot.user.name, bot.user.id)
     try:
         synced = await bot.tree.sync()
-        logger.info(f"Synced {len(synced)} command(s)")
+        logger.info("Synced %d command(s)", len(synced))
     except Exception as e:
-        logger.error(f"Failed to sync commands: {e}")
+        logger.error("Failed to sync commands: %s", e)
+    HELP_EMBEDS = build_help_embeds()
 
 @bot.tree.command(name="botinfo", description="Muestra información sobre el bot")
 async def botinfo(interaction: discord.Interaction):
@@ -89,26 +285,6 @@ async def botinfo(interaction: discord.Interaction):
     
     bot_name = bot.user.name
     bot_avatar = bot.user.display_avatar.url
-    bot_creation_date = bot.user.created_at
-    formatted_creation_date = bot_creation_date.strftime("%A, %d de %B de %Y, %H:%M")
-    
-    total_lines = 0
-    total_size = 0
-    
-    bot_file_path = Path(__file__)
-    if bot_file_path.is_file():
-        total_size = bot_file_path.stat().st_size
-        with open(bot_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            total_lines = sum(1 for _ in f)
-    
-    def format_bytes(bytes, decimals=2):
-        if bytes == 0:
-            return '0 Bytes'
-        k = 1024
-        dm = max(0, decimals)
-        sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB']
-        i = int(math.log(bytes, k))
-        return f"{bytes / (k ** i):.{dm}f} {sizes[i]}"
     
     embed = discord.Embed(
         title=f"Información de {bot_name}",
@@ -117,35 +293,34 @@ async def botinfo(interaction: discord.Interaction):
     )
     embed.set_thumbnail(url=bot_avatar)
     embed.add_field(name="🤖 Nombre", value=bot_name, inline=True)
-    embed.add_field(name="📅 Creado el", value=formatted_creation_date, inline=True)
+    embed.add_field(name="📅 Creado el", value=BOT_CREATED_AT_FMT, inline=True)
     embed.add_field(name="🔢 Versión", value="1.0.0", inline=True)
-    embed.add_field(name="📊 Estadísticas", value=f"**Líneas de código:** {total_lines}\n**Tamaño total:** {format_bytes(total_size)}", inline=False)
+    embed.add_field(name="📊 Estadísticas", value=f"**Líneas de código:** {BOT_FILE_LINES}\n**Tamaño total:** {BOT_FILE_SIZE_FMT}", inline=False)
     embed.add_field(name="👨‍💻 Autor", value="Platanotorrino Team", inline=True)
     embed.add_field(name="🔧 Tecnologías", value="Discord.py, Python", inline=True)
-    embed.set_footer(text="Platanotorrino Discord Bot")
-    embed.timestamp = datetime.datetime.now()
+    stamp_embed(embed)
     
     await interaction.followup.send(embed=embed)
 
-@bot.tree.command(name="quedadas", description="Muestra las quedadas activas y pendientes")
-async def quedadas(interaction: discord.Interaction):
-    meetups_data = get_meetups()
-    
-    if not meetups_data["meetups"]:
-        await interaction.response.send_message("No hay ninguna quedada pendiente actualmente.")
-        return
-    
+# /quedadas embed and view, rebuilt only after the meetups change
+_QUEDADAS_EMBED = None
+_QUEDADAS_VIEW = None
+_QUEDADAS_DIRTY = True
+
+def invalidate_quedadas_message():
+    global _QUEDADAS_DIRTY
+    _QUEDADAS_DIRTY = True
+
+def build_quedadas_message(meetups_data):
     embed = discord.Embed(
         title="Quedadas",
         description="Lista de quedadas activas y pendientes",
         color=0xffdd9e
     )
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
     
     view = discord.ui.View()
     
-    for meetup in meetups_data["meetups"]:
+    for meetup in meetups_data["meetups"].values():
         status_emoji = "🟢" if meetup["status"] == "activo" else "🟡"
         date = datetime.datetime.fromisoformat(meetup["date"].replace('Z', '+00:00'))
         formatted_date = date.strftime("%A, %d de %B de %Y, %H:%M")
@@ -163,7 +338,29 @@ async def quedadas(interaction: discord.Interaction):
         button = discord.ui.Button(label="Unirse a esta quedada", custom_id=f"join_meetup_{meetup['id']}", style=discord.ButtonStyle.primary)
         view.add_item(button)
     
-    await interaction.response.send_message(embed=embed, view=view)
+    return embed, view
+
+@bot.tree.command(name="quedadas", description="Muestra las quedadas activas y pendientes")
+async def quedadas(interaction: discord.Interaction):
+    global _QUEDADAS_EMBED, _QUEDADAS_VIEW, _QUEDADAS_DIRTY
+    meetups_data = await get_meetups()
+    
+    if not meetups_data["meetups"]:
+        await interaction.response.send_message("No hay ninguna quedada pendiente actualmente.")
+        return
+    
+    if _QUEDADAS_DIRTY or _QUEDADAS_EMBED is None:
+        _QUEDADAS_EMBED, _QUEDADAS_VIEW = build_quedadas_message(meetups_data)
+        _QUEDADAS_DIRTY = False
+    
+    embed = stamp_embed(_QUEDADAS_EMBED.copy())
+    
+    await interaction.response.send_message(embed=embed, view=_QUEDADAS_VIEW)
+
+ESTADO_CHOICES = [
+    app_commands.Choice(name="Activo", value="activo"),
+    app_commands.Choice(name="Pendiente", value="pendiente")
+]
 
 @bot.tree.command(name="crear-quedada", description="Crea una nueva quedada")
 @app_commands.describe(
@@ -174,10 +371,7 @@ async def quedadas(interaction: discord.Interaction):
     lugar="Lugar de la quedada",
     estado="Estado de la quedada"
 )
-@app_commands.choices(estado=[
-    app_commands.Choice(name="Activo", value="activo"),
-    app_commands.Choice(name="Pendiente", value="pendiente")
-])
+@app_commands.choices(estado=ESTADO_CHOICES)
 async def crear_quedada(
     interaction: discord.Interaction, 
     titulo: str, 
@@ -187,28 +381,24 @@ async def crear_quedada(
     lugar: str, 
     estado: str
 ):
-    import re
-    date_regex = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-    time_regex = re.compile(r'^\d{2}:\d{2}$')
-    
-    if not date_regex.match(fecha):
+    if not DATE_REGEX.match(fecha):
         await interaction.response.send_message("El formato de fecha debe ser YYYY-MM-DD (por ejemplo, 2023-12-31)", ephemeral=True)
         return
     
-    if not time_regex.match(hora):
+    if not TIME_REGEX.match(hora):
         await interaction.response.send_message("El formato de hora debe ser HH:MM (por ejemplo, 18:30)", ephemeral=True)
         return
     
     try:
-        year, month, day = map(int, fecha.split('-'))
-        hours, minutes = map(int, hora.split(':'))
-        date = datetime.datetime(year, month, day, hours, minutes, tzinfo=datetime.timezone.utc)
+        date = datetime.datetime.strptime(f"{fecha} {hora}", "%Y-%m-%d %H:%M").replace(tzinfo=datetime.timezone.utc)
     except ValueError:
         await interaction.response.send_message("La fecha y hora proporcionadas no son válidas", ephemeral=True)
         return
     
+    meetups_data = await get_meetups()
+    
     new_meetup = {
-        "id": generate_meetup_id(),
+        "id": generate_meetup_id(meetups_data),
         "title": titulo,
         "description": descripcion,
         "date": date.isoformat(),
@@ -217,138 +407,181 @@ async def crear_quedada(
         "participants": []
     }
     
-    meetups_data = get_meetups()
-    meetups_data["meetups"].append(new_meetup)
+    meetups_data["meetups"][new_meetup["id"]] = new_meetup
     
-    if save_meetups(meetups_data):
-        embed = discord.Embed(
-            title="Nueva Quedada Creada",
-            description=f'La quedada "{titulo}" ha sido creada correctamente.',
-            color=0xffdd9e
-        )
-        embed.add_field(name="Descripción", value=descripcion, inline=False)
-        embed.add_field(name="Fecha y Hora", value=date.strftime("%A, %d de %B de %Y, %H:%M"), inline=False)
-        embed.add_field(name="Lugar", value=lugar, inline=True)
-        embed.add_field(name="Estado", value=estado, inline=True)
-        embed.timestamp = datetime.datetime.now()
-        embed.set_footer(text="Platanotorrino Discord Bot")
-        
-        view = discord.ui.View()
-        button = discord.ui.Button(label="Unirse a esta quedada", custom_id=f"join_meetup_{new_meetup['id']}", style=discord.ButtonStyle.primary)
-        view.add_item(button)
-        
-        await interaction.response.send_message(embed=embed, view=view)
-    else:
-        await interaction.response.send_message("Ha ocurrido un error al crear la quedada", ephemeral=True)
-
-@bot.tree.command(name="hug", description="Da un abrazo a otro usuario")
-@app_commands.describe(usuario="Usuario al que quieres abrazar")
-async def hug(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("hug")
+    save_meetups(meetups_data)
     
     embed = discord.Embed(
-        title="¡Abrazo!",
-        description=f"{interaction.user.mention} le ha dado un cálido abrazo a {usuario.mention} 🤗",
-        color=0xffafc9
+        title="Nueva Quedada Creada",
+        description=f'La quedada "{titulo}" ha sido creada correctamente.',
+        color=0xffdd9e
     )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/u9BxQbM5bxvwY/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
+    embed.add_field(name="Descripción", value=descripcion, inline=False)
+    embed.add_field(name="Fecha y Hora", value=date.strftime("%A, %d de %B de %Y, %H:%M"), inline=False)
+    embed.add_field(name="Lugar", value=lugar, inline=True)
+    embed.add_field(name="Estado", value=estado, inline=True)
+    stamp_embed(embed)
     
-    await interaction.followup.send(embed=embed)
-
-@bot.tree.command(name="pat", description="Da una palmadita a otro usuario")
-@app_commands.describe(usuario="Usuario al que quieres dar una palmadita")
-async def pat(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("pat")
+    view = discord.ui.View()
+    button = discord.ui.Button(label="Unirse a esta quedada", custom_id=f"join_meetup_{new_meetup['id']}", style=discord.ButtonStyle.primary)
+    view.add_item(button)
     
-    embed = discord.Embed(
-        title="¡Palmadita!",
-        description=f"{interaction.user.mention} le ha dado una suave palmadita a {usuario.mention} 👋",
-        color=0xb8e986
+    await interaction.response.send_message(embed=embed, view=view)
+
+# name: (description, usuario description, title, message template, color, fallback GIF)
+INTERACTIONS = {
+    "hug": (
+        "Da un abrazo a otro usuario",
+        "Usuario al que quieres abrazar",
+        "¡Abrazo!",
+        "{user} le ha dado un cálido abrazo a {target} 🤗",
+        0xffafc9,
+        "https://media.giphy.com/media/u9BxQbM5bxvwY/giphy.gif"
+    ),
+    "pat": (
+        "Da una palmadita a otro usuario",
+        "Usuario al que quieres dar una palmadita",
+        "¡Palmadita!",
+        "{user} le ha dado una suave palmadita a {target} 👋",
+        0xb8e986,
+        "https://media.giphy.com/media/ARSp9T4wwxNcs/giphy.gif"
+    ),
+    "highfive": (
+        "Choca los cinco con otro usuario",
+        "Usuario con el que quieres chocar los cinco",
+        "¡Choca esos cinco!",
+        "{user} ha chocado los cinco con {target} ✋",
+        0xffd700,
+        "https://media.giphy.com/media/3oEjHV0z8S7WM4MwnK/giphy.gif"
+    ),
+    "poke": (
+        "Toca a otro usuario para llamar su atención",
+        "Usuario al que quieres tocar",
+        "¡Toque!",
+        "{user} ha tocado a {target} para llamar su atención 👉",
+        0x87ceeb,
+        "https://media.giphy.com/media/pWd3gD577gOqs/giphy.gif"
+    ),
+    "slap": (
+        "Da una bofetada a otro usuario",
+        "Usuario al que quieres dar una bofetada",
+        "¡Bofetada!",
+        "{user} le ha dado una bofetada a {target} 👋💥",
+        0xff6347,
+        "https://media.giphy.com/media/Zau0yrl17uzdK/giphy.gif"
+    ),
+    "kiss": (
+        "Da un beso a otro usuario",
+        "Usuario al que quieres dar un beso",
+        "¡Beso!",
+        "{user} le ha dado un dulce beso a {target} 💋",
+        0xff69b4,
+        "https://media.giphy.com/media/G3va31oEEnIkM/giphy.gif"
+    ),
+    "dance": (
+        "Baila con otro usuario",
+        "Usuario con el que quieres bailar",
+        "¡A bailar!",
+        "{user} está bailando con {target} 💃🕺",
+        0x9370db,
+        "https://media.giphy.com/media/l3q2Cy90VMhfoA8HC/giphy.gif"
     )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/ARSp9T4wwxNcs/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
-    
-    await interaction.followup.send(embed=embed)
+}
 
-@bot.tree.command(name="highfive", description="Choca los cinco con otro usuario")
-@app_commands.describe(usuario="Usuario con el que quieres chocar los cinco")
-async def highfive(interaction: discord.Interaction, usuario: discord.Member):
+async def send_interaction(kind, interaction: discord.Interaction, usuario: discord.Member):
     await interaction.response.defer()
     
-    gif_url = await fetch_nekotina_gif("highfive")
+    gif_url = await fetch_nekotina_gif(kind)
+    _, _, title, template, color, fallback_gif = INTERACTIONS[kind]
     
     embed = discord.Embed(
-        title="¡Choca esos cinco!",
-        description=f"{interaction.user.mention} ha chocado los cinco con {usuario.mention} ✋",
-        color=0xffd700
+        title=title,
+        description=template.format(user=interaction.user.mention, target=usuario.mention),
+        color=color
     )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/3oEjHV0z8S7WM4MwnK/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
+    embed.set_image(url=gif_url or fallback_gif)
+    stamp_embed(embed)
     
     await interaction.followup.send(embed=embed)
 
-@bot.tree.command(name="poke", description="Toca a otro usuario para llamar su atención")
-@app_commands.describe(usuario="Usuario al que quieres tocar")
-async def poke(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("poke")
+def register_interaction_command(kind):
+    description, usuario_description = INTERACTIONS[kind][:2]
     
-    embed = discord.Embed(
-        title="¡Toque!",
-        description=f"{interaction.user.mention} ha tocado a {usuario.mention} para llamar su atención 👉",
-        color=0x87ceeb
-    )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/pWd3gD577gOqs/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
+    @bot.tree.command(name=kind, description=description)
+    @app_commands.describe(usuario=usuario_description)
+    async def interaction_command(interaction: discord.Interaction, usuario: discord.Member):
+        await send_interaction(kind, interaction, usuario)
     
-    await interaction.followup.send(embed=embed)
+    return interaction_command
 
-@bot.tree.command(name="help", description="Muestra todos los comandos disponibles")
-@app_commands.describe(categoria="Categoría de comandos a mostrar (opcional)")
-@app_commands.choices(categoria=[
+for kind in INTERACTIONS:
+    register_interaction_command(kind)
+
+HELP_CATEGORIES = {
+    "admin": {
+        "name": "🛠️ Administración",
+        "description": "Comandos para administrar el bot y el servidor",
+        "commands": ["botinfo"]
+    },
+    "quedadas": {
+        "name": "📅 Quedadas",
+        "description": "Comandos para gestionar quedadas",
+        "commands": ["quedadas", "crear-quedada", "eliminar-quedada"]
+    },
+    "interaccion": {
+        "name": "👋 Interacción",
+        "description": "Comandos para interactuar con otros usuarios",
+        "commands": ["hug", "pat", "highfive", "poke", "slap", "kiss", "dance"]
+    },
+    "utilidades": {
+        "name": "🔧 Utilidades",
+        "description": "Comandos de utilidad general",
+        "commands": ["help"]
+    }
+}
+
+CATEGORIA_CHOICES = [
     app_commands.Choice(name="Todos", value="todos"),
     app_commands.Choice(name="Administración", value="admin"),
     app_commands.Choice(name="Quedadas", value="quedadas"),
     app_commands.Choice(name="Interacción", value="interaccion"),
     app_commands.Choice(name="Utilidades", value="utilidades")
-])
-async def help_command(interaction: discord.Interaction, categoria: str = "todos"):
-    await interaction.response.defer()
-    
-    categories = {
-        "admin": {
-            "name": "🛠️ Administración",
-            "description": "Comandos para administrar el bot y el servidor",
-            "commands": ["botinfo"]
-        },
-        "quedadas": {
-            "name": "📅 Quedadas",
-            "description": "Comandos para gestionar quedadas",
-            "commands": ["quedadas", "crear-quedada", "eliminar-quedada"]
-        },
-        "interaccion": {
-            "name": "👋 Interacción",
-            "description": "Comandos para interactuar con otros usuarios",
-            "commands": ["hug", "pat", "highfive", "poke", "slap", "kiss", "dance"]
-        },
-        "utilidades": {
-            "name": "🔧 Utilidades",
-            "description": "Comandos de utilidad general",
-            "commands": ["help"]
-        }
+]
+
+# One prebuilt /help embed per category plus "todos", filled in on_ready
+HELP_EMBEDS = {}
+
+def format_command_params(cmd):
+    params_info = ""
+    if hasattr(cmd, 'parameters') and cmd.parameters:
+        params = [f"<{param.name}>" for param in cmd.parameters]
+        if params:
+            params_info = f" {' '.join(params)}"
+    return params_info
+
+def build_help_embeds():
+    by_name = {cmd.name: cmd for cmd in bot.tree.get_commands()}
+    commands_by_category = {
+        cat_id: sorted((by_name[name] for name in cat_info['commands'] if name in by_name), key=lambda x: x.name)
+        for cat_id, cat_info in HELP_CATEGORIES.items()
     }
+    embeds = {}
     
-    all_commands = bot.tree.get_commands()
+    for cat_id, cat_info in HELP_CATEGORIES.items():
+        embed = discord.Embed(
+            title=f"Comandos de {cat_info['name']}",
+            description=cat_info['description'],
+            color=0x3498db
+        )
+        
+        for cmd in commands_by_category[cat_id]:
+            embed.add_field(
+                name=f"/{cmd.name}{format_command_params(cmd)}",
+                value=cmd.description or "Sin descripción disponible",
+                inline=False
+            )
+        
+        embeds[cat_id] = embed
     
     embed = discord.Embed(
         title="Comandos Disponibles",
@@ -356,55 +589,35 @@ async def help_command(interaction: discord.Interaction, categoria: str = "todos
         color=0x3498db
     )
     
-    def add_commands_to_embed(commands_list):
-        for cmd in commands_list:
-            params_info = ""
-            if hasattr(cmd, 'parameters') and cmd.parameters:
-                params = [f"<{param.name}>" for param in cmd.parameters]
-                if params:
-                    params_info = f" {' '.join(params)}"
-            
-            embed.add_field(
-                name=f"/{cmd.name}{params_info}",
-                value=cmd.description or "Sin descripción disponible",
-                inline=False
-            )
-    
-    if categoria != "todos" and categoria in categories:
-        cat_info = categories[categoria]
-        embed.title = f"Comandos de {cat_info['name']}"
-        embed.description = cat_info['description']
-        
-        category_commands = [cmd for cmd in all_commands if cmd.name in cat_info['commands']]
-        category_commands.sort(key=lambda x: x.name)
+    for cat_id, cat_info in HELP_CATEGORIES.items():
+        embed.add_field(
+            name=cat_info['name'],
+            value=cat_info['description'],
+            inline=False
+        )
         
-        add_commands_to_embed(category_commands)
-    else:
-        for cat_id, cat_info in categories.items():
+        for cmd in commands_by_category[cat_id]:
             embed.add_field(
-                name=cat_info['name'],
-                value=cat_info['description'],
+                name=f"  /{cmd.name}{format_command_params(cmd)}",
+                value=f"  {cmd.description or 'Sin descripción disponible'}",
                 inline=False
             )
-            
-            category_commands = [cmd for cmd in all_commands if cmd.name in cat_info['commands']]
-            category_commands.sort(key=lambda x: x.name)
-            
-            for cmd in category_commands:
-                params_info = ""
-                if hasattr(cmd, 'parameters') and cmd.parameters:
-                    params = [f"<{param.name}>" for param in cmd.parameters]
-                    if params:
-                        params_info = f" {' '.join(params)}"
-                
-                embed.add_field(
-                    name=f"  /{cmd.name}{params_info}",
-                    value=f"  {cmd.description or 'Sin descripción disponible'}",
-                    inline=False
-                )
-    
-    embed.set_footer(text="Usa /help <categoria> para ver comandos específicos")
-    embed.timestamp = datetime.datetime.now()
+    
+    embeds["todos"] = embed
+    
+    return embeds
+
+@bot.tree.command(name="help", description="Muestra todos los comandos disponibles")
+@app_commands.describe(categoria="Categoría de comandos a mostrar (opcional)")
+@app_commands.choices(categoria=CATEGORIA_CHOICES)
+async def help_command(interaction: discord.Interaction, categoria: str = "todos"):
+    global HELP_EMBEDS
+    await interaction.response.defer()
+    
+    if not HELP_EMBEDS:
+        HELP_EMBEDS = build_help_embeds()
+    
+    embed = stamp_embed(HELP_EMBEDS.get(categoria, HELP_EMBEDS["todos"]).copy(), footer=HELP_FOOTER_TEXT)
     
     await interaction.followup.send(embed=embed)
 
@@ -415,90 +628,26 @@ async def eliminar_quedada(interaction: discord.Interaction, id_quedada: int):
         await interaction.response.send_message("No tienes permisos para eliminar quedadas", ephemeral=True)
         return
     
-    meetups_data = get_meetups()
+    meetups_data = await get_meetups()
     
-    meetup_index = None
-    for i, meetup in enumerate(meetups_data["meetups"]):
-        if meetup["id"] == id_quedada:
-            meetup_index = i
-            break
+    meetup = meetups_data["meetups"].pop(id_quedada, None)
     
-    if meetup_index is None:
+    if meetup is None:
         await interaction.response.send_message(f"No se encontró ninguna quedada con ID {id_quedada}", ephemeral=True)
         return
     
-    meetup = meetups_data["meetups"][meetup_index]
-    
-    del meetups_data["meetups"][meetup_index]
-    
-    if save_meetups(meetups_data):
-        embed = discord.Embed(
-            title="Quedada Eliminada",
-            description=f'La quedada "{meetup["title"]}" ha sido eliminada correctamente.',
-            color=0xff6961
-        )
-        embed.add_field(name="ID", value=str(meetup["id"]), inline=True)
-        embed.add_field(name="Estado", value=meetup["status"], inline=True)
-        embed.timestamp = datetime.datetime.now()
-        embed.set_footer(text="Platanotorrino Discord Bot")
-        
-        await interaction.response.send_message(embed=embed)
-    else:
-        await interaction.response.send_message("Ha ocurrido un error al eliminar la quedada", ephemeral=True)
-
-@bot.tree.command(name="slap", description="Da una bofetada a otro usuario")
-@app_commands.describe(usuario="Usuario al que quieres dar una bofetada")
-async def slap(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("slap")
+    save_meetups(meetups_data)
     
     embed = discord.Embed(
-        title="¡Bofetada!",
-        description=f"{interaction.user.mention} le ha dado una bofetada a {usuario.mention} 👋💥",
-        color=0xff6347
+        title="Quedada Eliminada",
+        description=f'La quedada "{meetup["title"]}" ha sido eliminada correctamente.',
+        color=0xff6961
     )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/Zau0yrl17uzdK/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
+    embed.add_field(name="ID", value=str(meetup["id"]), inline=True)
+    embed.add_field(name="Estado", value=meetup["status"], inline=True)
+    stamp_embed(embed)
     
-    await interaction.followup.send(embed=embed)
-
-@bot.tree.command(name="kiss", description="Da un beso a otro usuario")
-@app_commands.describe(usuario="Usuario al que quieres dar un beso")
-async def kiss(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("kiss")
-    
-    embed = discord.Embed(
-        title="¡Beso!",
-        description=f"{interaction.user.mention} le ha dado un dulce beso a {usuario.mention} 💋",
-        color=0xff69b4
-    )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/G3va31oEEnIkM/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
-    
-    await interaction.followup.send(embed=embed)
-
-@bot.tree.command(name="dance", description="Baila con otro usuario")
-@app_commands.describe(usuario="Usuario con el que quieres bailar")
-async def dance(interaction: discord.Interaction, usuario: discord.Member):
-    await interaction.response.defer()
-    
-    gif_url = await fetch_nekotina_gif("dance")
-    
-    embed = discord.Embed(
-        title="¡A bailar!",
-        description=f"{interaction.user.mention} está bailando con {usuario.mention} 💃🕺",
-        color=0x9370db
-    )
-    embed.set_image(url=gif_url or "https://media.giphy.com/media/l3q2Cy90VMhfoA8HC/giphy.gif")
-    embed.timestamp = datetime.datetime.now()
-    embed.set_footer(text="Platanotorrino Discord Bot")
-    
-    await interaction.followup.send(embed=embed)
+    await interaction.response.send_message(embed=embed)
 
 if __name__ == "__main__":
     bot.run(TOKEN)
\ No newline at end of file